@@ -2,14 +2,13 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
-import json
 import logging
 import shutil
 from pathlib import Path
 from typing import Optional, Union
 
 from olive.common.config_utils import serialize_to_json
-from olive.common.utils import hash_dict
+from olive.common.utils import dump_json, hash_dict, load_json
 from olive.resource_path import ResourcePath, create_resource_path
 
 logger = logging.getLogger(__name__)
@@ -83,8 +82,7 @@ def _delete_run(run_id: str, cache_dir: Union[str, Path] = ".olive-cache"):
     run_cache_dir = get_cache_sub_dirs(cache_dir)[1]
     run_json = run_cache_dir / f"{run_id}.json"
     try:
-        with run_json.open("r") as f:
-            run_data = json.load(f)
+        run_data = load_json(run_json)
         # output model and children
         output_model_number = run_data["output_model_id"].split("_")[0]
         _delete_model(output_model_number, cache_dir)
@@ -126,8 +124,7 @@ def download_resource(resource_path: ResourcePath, cache_dir: Union[str, Path] =
     # check if resource path is cached
     if resource_path_json.exists():
         logger.debug(f"Using cached resource path {resource_path.to_json()}")
-        with resource_path_json.open("r") as f:
-            resource_path_data = json.load(f)["dest"]
+        resource_path_data = load_json(resource_path_json)["dest"]
         return create_resource_path(resource_path_data)
 
     # cache resource path
@@ -143,9 +140,8 @@ def download_resource(resource_path: ResourcePath, cache_dir: Union[str, Path] =
 
     # cache resource path
     logger.debug(f"Caching resource path {resource_path}")
-    with resource_path_json.open("w") as f:
-        data = {"source": resource_path.to_json(), "dest": local_resource_path.to_json()}
-        json.dump(data, f, indent=4)
+    data = {"source": resource_path.to_json(), "dest": local_resource_path.to_json()}
+    dump_json(data, resource_path_json)
 
     return local_resource_path
 
@@ -184,8 +180,7 @@ def save_model(
     model_jsons = list(model_cache_dir.glob(f"{model_number}_*.json"))
     assert len(model_jsons) == 1, f"No model found for {model_number}"
 
-    with model_jsons[0].open("r") as f:
-        model_json = serialize_to_json(json.load(f))
+    model_json = serialize_to_json(load_json(model_jsons[0]))
 
     if model_json["type"].lower() == "compositeonnxmodel":
         logger.warning("Saving composite ONNX models is not supported yet.")
@@ -205,7 +200,6 @@ def save_model(
 
     # save model json
     model_json["config"]["model_path"] = model_path
-    with open(output_dir / f"{output_name}.json", "w") as f:
-        json.dump(model_json, f, indent=4)
+    dump_json(model_json, output_dir / f"{output_name}.json")
 
     return model_json
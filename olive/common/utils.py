@@ -7,6 +7,7 @@ import inspect
 import io
 import json
 import logging
+import os
 import pickle
 import platform
 import shlex
@@ -14,6 +15,11 @@ import shutil
 import subprocess
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,11 +61,40 @@ def hash_file(filename):  # pragma: no cover
         return hash_io_stream(f)
 
 
+def dump_json(obj, file_path, indent=4):
+    """
+    Serialize an object to JSON and write it to a file in a single write.
+
+    Uses orjson when available since it is much faster than the stdlib serializer. orjson only supports
+    2-space indentation, which is acceptable since the files are only indented for human readability.
+
+    The file is written to a temporary sibling first and moved into place with os.replace, which is
+    atomic on both POSIX and Windows, so readers never observe a half-written file.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        data = json.dumps(obj, indent=indent).encode()
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+
+
+def load_json(file_path):
+    """
+    Load a JSON file. Uses orjson when available since it parses bytes natively.
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 def hash_dict(dictionary):  # pragma: no cover
-    md5_hash = hashlib.md5()
     encoded_dictionary = json.dumps(dictionary, sort_keys=True).encode()
-    md5_hash.update(encoded_dictionary)
-    return md5_hash.hexdigest()
+    # the hash is only used as a cache key; blake2b is considerably faster than md5 and a
+    # 16 byte digest keeps the key the same length as before
+    return hashlib.blake2b(encoded_dictionary, digest_size=16).hexdigest()
 
 
 def hash_function(function):  # pragma: no cover
@@ -2,21 +2,23 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 # --------------------------------------------------------------------------
-import json
+import heapq
 import logging
+import os
 import time
+import weakref
 from collections import OrderedDict, defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import olive.cache as cache_utils
 from olive.common.config_utils import ConfigBase, validate_config
-from olive.common.utils import hash_dict
+from olive.common.utils import dump_json, hash_dict, load_json
 from olive.engine.config import PRUNED_CONFIG, EngineConfig
 from olive.engine.footprint import Footprint, FootprintNode, FootprintNodeMetric
 from olive.engine.packaging.packaging_config import PackagingConfig
 from olive.engine.packaging.packaging_generator import generate_output_artifacts
-from olive.evaluator.metric import Metric, MetricResult, joint_metric_key
+from olive.evaluator.metric import Metric, MetricResult, MetricType, joint_metric_key
 from olive.evaluator.olive_evaluator import OliveEvaluatorConfig
 from olive.exception import OlivePassException
 from olive.hardware import AcceleratorLookup, AcceleratorSpec, Device
@@ -31,6 +33,19 @@ logger = logging.getLogger(__name__)
 
 EXCEPTIONS_TO_RAISE = (AttributeError, ImportError, TypeError, ValueError)
 
+# maximum number of model jsons kept in memory to avoid re-reading them from the cache directory
+MODEL_JSON_CACHE_SIZE = 64
+RUN_RECORD_CACHE_SIZE = 4096
+
+# resolution of a goal value into a threshold given the baseline value and the higher_is_better multiplier
+_GOAL_OPS = {
+    "threshold": lambda baseline, multiplier, value: value,
+    "max-degradation": lambda baseline, multiplier, value: baseline - multiplier * value,
+    "min-improvement": lambda baseline, multiplier, value: baseline + multiplier * value,
+    "percent-max-degradation": lambda baseline, multiplier, value: baseline * (1 - multiplier * value / 100),
+    "percent-min-improvement": lambda baseline, multiplier, value: baseline * (1 + multiplier * value / 100),
+}
+
 
 class Engine:
     """
@@ -106,11 +121,17 @@ class Engine:
         processed_ep = set()
         self.accelerator_specs: List[AcceleratorSpec] = []
         is_cpu_available = "cpu" in [accelerator.lower() for accelerator in accelerators]
+        # cache the supported execution providers per device so that duplicate devices don't query again
+        supported_eps_by_device: Dict[Device, frozenset] = {}
         for accelerator in accelerators:
             device = Device(accelerator.lower())
-            supported_eps = AcceleratorLookup.get_execution_providers_for_device(device)
-            eps = [e for e in self.execution_providers if e not in processed_ep]
-            for ep in eps:
+            supported_eps = supported_eps_by_device.get(device)
+            if supported_eps is None:
+                supported_eps = frozenset(AcceleratorLookup.get_execution_providers_for_device(device))
+                supported_eps_by_device[device] = supported_eps
+            for ep in self.execution_providers:
+                if ep in processed_ep:
+                    continue
                 if ep not in supported_eps:
                     not_supported_ep.add(ep)
                     processed_ep.add(ep)
@@ -135,13 +156,43 @@ class Engine:
             self.evaluator_config = self._config.evaluator
 
         # dictionary of passes
-        self.pass_config = OrderedDict()
+        # plain dicts preserve insertion order since Python 3.7 without the OrderedDict overhead
+        self.pass_config = {}
 
         # {"pass_name": {"pass": pass, "host": host, "evaluator": evaluator, "clean_run_cache": clean_run_cache}}
-        self.passes = OrderedDict()
+        self.passes = {}
+
+        # counters for auto-generated pass names so registering many passes of the same type stays linear
+        self._pass_config_name_counts = defaultdict(int)
+        self._pass_name_counts = defaultdict(int)
+
+        # serialized pass configs and their hashes keyed by (pass id, search point) so revisited
+        # search points skip config serialization and hashing
+        self._pass_config_cache = {}
+
+        # is_accelerator_agnostic results keyed by (pass id, accelerator spec), constant per pair
+        self._pass_accel_agnostic = {}
 
         self.footprints = defaultdict(Footprint)
 
+        # LRU cache of model jsons keyed by model id. Only the jsons are cached, not the created models,
+        # since passes may mutate a loaded model (e.g. resolve its model path locally).
+        self._model_json_cache = OrderedDict()
+
+        # LRU caches of run and evaluation records keyed by their cache file path so repeated probes
+        # for the same search point become dict lookups instead of disk reads
+        self._run_record_cache = OrderedDict()
+        self._evaluation_record_cache = OrderedDict()
+
+        # cache of model jsons keyed by live model objects so the same model is not serialized repeatedly.
+        # entries disappear when the model object is garbage collected and are dropped when the model is
+        # mutated by the engine.
+        self._model_to_json_cache = weakref.WeakKeyDictionary()
+
+        # baseline evaluation results keyed by input model id, shared across accelerator specs when the
+        # metrics don't depend on the accelerator
+        self._baseline_results: Dict[str, MetricResult] = {}
+
         self.azureml_client_config = self._config.azureml_client_config
 
         self._initialized = False
@@ -161,17 +212,23 @@ class Engine:
         )
         cache_utils.create_cache(cache_dir)
 
+        # run json paths are built as plain strings on the hot path, precompute the directory prefix
+        self._run_cache_prefix = f"{self._run_cache_path}{os.sep}"
+
         # initialize counters
         # we do this before cleaning pass run caches to ensure we don't reuse model numbers even if the model was
         # deleted from the cache
-        self._new_model_number = 0
         # model jsons have the format <model_number>_<pass_type>-<source_model>-<pass_config_hash>.json
         # model contents are stored in <model_number>_<pass_type>-<source_model>-<pass_config_hash> folder
         # sometimes the folder is created with contents but the json is not created when the pass fails to run
         # so we check for both when determining the new model number
-        model_files = list(self._model_cache_path.glob("*_*"))
-        if len(model_files) > 0:
-            self._new_model_number = max([int(model_file.stem.split("_")[0]) for model_file in model_files]) + 1
+        # iterdir is backed by os.scandir and avoids the per-entry fnmatch of glob("*_*")
+        self._used_model_numbers = {
+            int(model_file.name.partition("_")[0])
+            for model_file in self._model_cache_path.iterdir()
+            if "_" in model_file.name
+        }
+        self._new_model_number = max(self._used_model_numbers, default=-1) + 1
 
         # clean pass run cache if requested
         # removes all run cache for pass type and all children elements
@@ -197,14 +254,15 @@ class Engine:
         if name is not None:
             assert name not in self.passes, f"Pass with name {name} already registered"
         else:
-            id = 0
+            base_name = pass_type.__name__
+            # start from the counter instead of 0 so the scan for a free name is amortized O(1)
+            id = self._pass_config_name_counts[base_name]
             while True:
-                name = pass_type.__name__
-                if id > 0:
-                    name = f"{name}_{id}"
+                name = base_name if id == 0 else f"{base_name}_{id}"
                 id += 1
                 if name not in self.pass_config:
                     break
+            self._pass_config_name_counts[base_name] = id
 
         self.pass_config[name] = {
             "type": pass_type,
@@ -230,14 +288,14 @@ class Engine:
         if name is not None:
             assert name not in self.passes, f"Pass with name {name} already registered"
         else:
-            id = 0
+            base_name = p.__class__.__name__
+            id = self._pass_name_counts[base_name]
             while True:
-                name = p.__class__.__name__
-                if id > 0:
-                    name = f"{name}_{id}"
+                name = base_name if id == 0 else f"{base_name}_{id}"
                 id += 1
                 if name not in self.passes:
                     break
+            self._pass_name_counts[base_name] = id
 
         if self.no_search and len(p.search_space()) > 0:
             raise ValueError(f"Search strategy is None but pass {name} has search space")
@@ -280,51 +338,16 @@ class Engine:
 
         outputs = {}
         pf_footprints = {}
+        # the accelerators are otherwise independent but have to run serially: setup_passes rebuilds
+        # self.passes and the search strategy state for each accelerator
         for accelerator_spec in self.accelerator_specs:
-            # generate search space and initialize the passes for each hardware accelerator
-            self.setup_passes(accelerator_spec)
-
-            # hash the input model
-            input_model_id = self._init_input_model(input_model)
-            self.footprints[accelerator_spec].record(model_id=input_model_id)
-
-            try:
-                if evaluation_only:
-                    prefix_output_name = (
-                        f"{output_name}_{accelerator_spec}_" if output_name is not None else f"{accelerator_spec}_"
-                    )
-                    assert self.evaluator_config is not None, "Evaluation only is True but no evaluator provided"
-                    results = self._evaluate_model(input_model, input_model_id, self.evaluator_config, accelerator_spec)
-                    result_name = f"{prefix_output_name}metrics"
-                    results_path = output_dir / f"{result_name}.json"
-                    with open(results_path, "w") as f:
-                        json.dump(results.to_json(), f, indent=4)
-                    outputs[accelerator_spec] = results
-                elif self.no_search:
-                    output = self.run_no_search(
-                        input_model,
-                        input_model_id,
-                        accelerator_spec,
-                        output_dir,
-                        output_name,
-                    )
-                    if output:
-                        outputs[accelerator_spec] = output
-                        pf_footprints[accelerator_spec] = self.footprints[accelerator_spec].get_last_node()
-                else:
-                    footprint = self.run_search(
-                        input_model,
-                        input_model_id,
-                        accelerator_spec,
-                        output_dir,
-                        output_name,
-                    )
-                    outputs[accelerator_spec] = footprint
-                    pf_footprints[accelerator_spec] = footprint
-            except EXCEPTIONS_TO_RAISE:
-                raise
-            except Exception as e:
-                logger.warning(f"Failed to run Olive on {accelerator_spec}: {e}", exc_info=True)
+            output, pf_footprint = self._run_accelerator(
+                input_model, accelerator_spec, output_dir, output_name, evaluation_only
+            )
+            if output is not None:
+                outputs[accelerator_spec] = output
+            if pf_footprint is not None:
+                pf_footprints[accelerator_spec] = pf_footprint
 
         if packaging_config:
             logger.info(f"Package top ranked {sum([len(f.nodes) for f in pf_footprints.values()])} models as artifacts")
@@ -339,9 +362,70 @@ class Engine:
 
         return outputs
 
+    def _run_accelerator(
+        self,
+        input_model: OliveModel,
+        accelerator_spec: AcceleratorSpec,
+        output_dir: Path,
+        output_name: str,
+        evaluation_only: bool,
+    ):
+        """
+        Run the registered passes and/or evaluation on the input model for one accelerator.
+
+        Return a tuple of (output, pareto frontier footprint); both are None if the run failed or
+        produced no output.
+        """
+        # generate search space and initialize the passes for each hardware accelerator
+        self.setup_passes(accelerator_spec)
+
+        # hash the input model
+        input_model_id = self._init_input_model(input_model)
+        self.footprints[accelerator_spec].record(model_id=input_model_id)
+
+        # compute the output name prefix for this accelerator once, it is the same for all output files
+        prefix_output_name = f"{output_name}_{accelerator_spec}_" if output_name is not None else f"{accelerator_spec}_"
+
+        try:
+            if evaluation_only:
+                assert self.evaluator_config is not None, "Evaluation only is True but no evaluator provided"
+                results = self._evaluate_model(input_model, input_model_id, self.evaluator_config, accelerator_spec)
+                result_name = f"{prefix_output_name}metrics"
+                results_path = output_dir / f"{result_name}.json"
+                dump_json(results.to_json(), results_path)
+                return results, None
+            elif self.no_search:
+                output = self.run_no_search(
+                    input_model,
+                    input_model_id,
+                    accelerator_spec,
+                    output_dir,
+                    output_name,
+                )
+                if output:
+                    return output, self.footprints[accelerator_spec].get_last_node()
+            else:
+                footprint = self.run_search(
+                    input_model,
+                    input_model_id,
+                    accelerator_spec,
+                    output_dir,
+                    prefix_output_name,
+                )
+                return footprint, footprint
+        except EXCEPTIONS_TO_RAISE:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to run Olive on {accelerator_spec}: {e}", exc_info=True)
+
+        return None, None
+
     def setup_passes(self, accelerator_spec: AcceleratorSpec):
         # clean the passes
         self.passes.clear()
+        self._pass_name_counts.clear()
+        self._pass_config_cache.clear()
+        self._pass_accel_agnostic.clear()
         for config in self.pass_config.values():
             pass_cls: Type[Pass] = config["type"]
             pass_cfg = config["config"]
@@ -371,7 +455,7 @@ class Engine:
                 pass_name = pass_item["name"]
                 raise ValueError(f"Pass {pass_name} has search space but search strategy is None")
 
-        evaluator_config = self.evaluator_for_pass(list(self.passes.keys())[-1])
+        evaluator_config = self.evaluator_for_pass(next(reversed(self.passes)))
         if evaluator_config is None:
             # provide dummy objective
             objective_dict = {"dummy": {"higher_is_better": True, "goal": 0}}
@@ -403,17 +487,20 @@ class Engine:
             model_ids,
         ) = self._run_passes(next_step["passes"], model, model_id, accelerator_spec)
         # names of the output models of the passes
-        pass_output_names = [self.passes[pass_name]["output_name"] for pass_name, _ in next_step["passes"]]
-        pass_output_names = [f"{name}_{accelerator_spec}" if name else None for name in pass_output_names]
+        accelerator_str = str(accelerator_spec)
+        pass_output_names = [
+            f"{name}_{accelerator_str}" if name else None
+            for name in (self.passes[pass_name]["output_name"] for pass_name, _ in next_step["passes"])
+        ]
 
         final_output_name = pass_output_names[-1]
         if output_name:
             # override the output name of the last pass
             logger.debug("Engine output_name is provided. Will ignore output_name for final pass")
-            final_output_name = f"{output_name}_{accelerator_spec}"
+            final_output_name = f"{output_name}_{accelerator_str}"
         elif not final_output_name:
             # use the default output name
-            final_output_name = str(accelerator_spec)
+            final_output_name = accelerator_str
         pass_output_names[-1] = final_output_name
 
         output_model_json = None
@@ -432,8 +519,7 @@ class Engine:
         if signal is not None:
             result_name = f"{final_output_name}_metrics"
             results_path = output_dir / f"{result_name}.json"
-            with open(results_path, "w") as f:
-                json.dump(signal.to_json(), f, indent=4)
+            dump_json(signal.to_json(), results_path)
 
         if output_model_json:
             output = {"model": output_model_json}
@@ -450,7 +536,7 @@ class Engine:
         input_model_id: str,
         accelerator_spec: AcceleratorSpec,
         output_dir: str = None,
-        output_name: str = None,
+        prefix_output_name: str = None,
     ):
         """
         Run all the registered Olive passes on the input model and produce one or more candidate models.
@@ -464,10 +550,10 @@ class Engine:
         TODO: save the results using updated RunResult
         """
 
-        prefix_output_name = f"{output_name}_{accelerator_spec}_" if output_name is not None else f"{accelerator_spec}_"
+        prefix_output_name = prefix_output_name if prefix_output_name is not None else f"{accelerator_spec}_"
 
         # get objective_dict
-        evaluator_config = self.evaluator_for_pass(list(self.passes.keys())[-1])
+        evaluator_config = self.evaluator_for_pass(next(reversed(self.passes)))
 
         if evaluator_config is None:
             raise ValueError("No evaluator provided for the last pass")
@@ -483,6 +569,10 @@ class Engine:
         # record start time
         start_time = time.time()
         iter_num = 0
+        # TODO: the search strategy proposes one search point per step and needs its feedback signal
+        # before the next step, so candidates cannot be dispatched concurrently. If a strategy that
+        # proposes batches of independent candidates is added, this loop is the place to fan them out
+        # to a thread pool (host/target runs are subprocess or remote bound).
         while True:
             iter_num += 1
 
@@ -511,7 +601,10 @@ class Engine:
             time_diff = time.time() - start_time
             self.search_strategy.check_exit_criteria(iter_num, time_diff, signal)
 
-        self.footprints[accelerator_spec].to_file(output_dir / f"{prefix_output_name}footprints.json")
+        # base path prefix shared by all files produced by this search run
+        output_prefix = str(output_dir / prefix_output_name)
+
+        self.footprints[accelerator_spec].to_file(f"{output_prefix}footprints.json")
 
         pf_footprints = self.footprints[accelerator_spec].get_pareto_frontier()
         if output_model_num is None or len(pf_footprints.nodes) <= output_model_num:
@@ -521,11 +614,11 @@ class Engine:
             logger.info(f"Output top ranked {len(top_ranked_nodes)} models based on metric priorities")
             pf_footprints.update_nodes(top_ranked_nodes)
 
-        pf_footprints.to_file(output_dir / f"{prefix_output_name}pareto_frontier_footprints.json")
+        pf_footprints.to_file(f"{output_prefix}pareto_frontier_footprints.json")
 
         if self._config.plot_pareto_frontier:
             pf_footprints.plot_pareto_frontier_to_html(
-                save_path=output_dir / f"{prefix_output_name}pareto_frontier_footprints_chart.html"
+                save_path=f"{output_prefix}pareto_frontier_footprints_chart.html"
             )
 
         return pf_footprints
@@ -581,47 +674,49 @@ class Engine:
         if goals:
             logger.debug(f"Resolving goals: {goals}")
 
+        # the baseline is only needed for goals that are relative to it; any() short-circuits on the first one
+        needs_baseline = any(
+            sub_goal and sub_goal.type != "threshold" for goal in goals.values() for sub_goal in goal.values()
+        )
         baseline = None
-        for goal in goals.values():
-            _evaluated = False
-            for sub_goal in goal.values():
-                if not sub_goal:
-                    break
-                if sub_goal.type != "threshold":
-                    assert self.evaluator_config is not None, "Default evaluator must be provided to resolve goals"
-                    logger.debug("Computing baseline for metrics ...")
-                    baseline = self._evaluate_model(
-                        input_model, input_model_id, self.evaluator_config, accelerator_spec
-                    )
-                    _evaluated = True
-                    break
-            if _evaluated:
-                break
+        if needs_baseline:
+            assert self.evaluator_config is not None, "Default evaluator must be provided to resolve goals"
+            # accuracy metrics don't depend on the accelerator, so their baseline can be shared across
+            # accelerator specs; latency and custom metrics are re-evaluated per accelerator
+            reusable_baseline = all(metric.type == MetricType.ACCURACY for metric in self.evaluator_config.metrics)
+            baseline = self._baseline_results.get(input_model_id) if reusable_baseline else None
+            if baseline is not None:
+                logger.debug("Reusing baseline evaluated for a previous accelerator ...")
+                # footprint the baseline for this accelerator like _evaluate_model would have.
+                # Note: this path skips _cache_evaluation, so later accelerators get no on-disk
+                # evaluation record and a fresh process re-evaluates their baseline once.
+                self.footprints[accelerator_spec].record(
+                    model_id=input_model_id,
+                    metrics=FootprintNodeMetric(
+                        value=baseline,
+                        is_goals_met=False,
+                    ),
+                )
+            else:
+                logger.debug("Computing baseline for metrics ...")
+                baseline = self._evaluate_model(input_model, input_model_id, self.evaluator_config, accelerator_spec)
+                if reusable_baseline and baseline:
+                    self._baseline_results[input_model_id] = baseline
         if not baseline:
             logger.debug("No baseline got as no goal is provided the the goal is threshold")
             return {}
 
-        if baseline:
-            logger.debug(f"Baseline: {baseline}")
+        logger.debug(f"Baseline: {baseline}")
 
         # resolve goals to thresholds
         resolved_goals = {}
         for metric_name, sub_type_goals in goals.items():
+            sub_type_multipliers = multipliers[metric_name]
             for sub_type_name, goal in sub_type_goals.items():
-                # TODO: make the logic cleaner
-                resolved_goal_value = None
                 baseline_sub_type = baseline.get_value(metric_name, sub_type_name)
-                multiplier = multipliers[metric_name][sub_type_name]
-                if goal.type == "threshold":
-                    resolved_goal_value = goal.value
-                elif goal.type == "max-degradation":
-                    resolved_goal_value = baseline_sub_type - multiplier * goal.value
-                elif goal.type == "min-improvement":
-                    resolved_goal_value = baseline_sub_type + multiplier * goal.value
-                elif goal.type == "percent-max-degradation":
-                    resolved_goal_value = baseline_sub_type * (1 - multiplier * goal.value / 100)
-                elif goal.type == "percent-min-improvement":
-                    resolved_goal_value = baseline_sub_type * (1 + multiplier * goal.value / 100)
+                multiplier = sub_type_multipliers[sub_type_name]
+                goal_op = _GOAL_OPS.get(goal.type)
+                resolved_goal_value = goal_op(baseline_sub_type, multiplier, goal.value) if goal_op else None
 
                 resolved_goals[joint_metric_key(metric_name, sub_type_name)] = resolved_goal_value
         if len(resolved_goals) > 0:
@@ -648,11 +743,11 @@ class Engine:
         """
         Get a new model number.
         """
-        while True:
-            new_model_number = self._new_model_number
+        while self._new_model_number in self._used_model_numbers:
             self._new_model_number += 1
-            if list(self._model_cache_path.glob(f"{new_model_number}_*")) == []:
-                break
+        new_model_number = self._new_model_number
+        self._used_model_numbers.add(new_model_number)
+        self._new_model_number += 1
         return new_model_number
 
     def get_model_json_path(self, model_id: str) -> Path:
@@ -669,25 +764,68 @@ class Engine:
         if model == PRUNED_CONFIG:
             model_json = {}
         else:
-            model_json = model.to_json(check_object=check_object)
+            model_json = self._model_to_json(model, check_object=check_object)
         model_json_path = self.get_model_json_path(model_id)
+        self._memoize_model_json(model_id, model_json)
         try:
-            with open(model_json_path, "w") as f:
-                json.dump(model_json, f, indent=4)
+            dump_json(model_json, model_json_path)
         except Exception as e:
             logger.error(f"Failed to cache model: {e}", exc_info=True)
 
+    def _model_to_json(self, model: OliveModel, check_object: bool = False) -> dict:
+        """
+        Get the json of a model, memoized on the model object.
+        """
+        cached = self._model_to_json_cache.get(model)
+        if cached is not None:
+            if check_object in cached:
+                return cached[check_object]
+            if not check_object and True in cached:
+                # check_object only adds validation on top of the same json, so the validated
+                # result can serve plain requests too; e.g. the footprint record in _run_pass
+                # reuses the json that _cache_model just produced
+                return cached[True]
+        model_json = model.to_json(check_object=check_object)
+        if cached is None:
+            self._model_to_json_cache[model] = {check_object: model_json}
+        else:
+            cached[check_object] = model_json
+        return model_json
+
+    def _memoize_model_json(self, model_id: str, model_json: dict):
+        """
+        Store the model json in the in-memory LRU cache.
+        """
+        self._model_json_cache[model_id] = model_json
+        self._model_json_cache.move_to_end(model_id)
+        if len(self._model_json_cache) > MODEL_JSON_CACHE_SIZE:
+            self._model_json_cache.popitem(last=False)
+
+    @staticmethod
+    def _memoize_record(cache: OrderedDict, key, value):
+        """
+        Store a run/evaluation record in a bounded in-memory LRU cache.
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > RUN_RECORD_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def _load_model(self, model_id: str) -> Union[OliveModel, str]:
         """
         Load the model from the cache directory.
         """
-        model_json_path = self.get_model_json_path(model_id)
-        try:
-            with open(model_json_path, "r") as f:
-                model_json = json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load model: {e}", exc_info=True)
-            return None
+        model_json = self._model_json_cache.get(model_id)
+        if model_json is not None:
+            self._model_json_cache.move_to_end(model_id)
+        else:
+            model_json_path = self.get_model_json_path(model_id)
+            try:
+                model_json = load_json(model_json_path)
+            except Exception as e:
+                logger.error(f"Failed to load model: {e}", exc_info=True)
+                return None
+            self._memoize_model_json(model_id, model_json)
 
         if model_json == {}:
             return PRUNED_CONFIG
@@ -714,6 +852,8 @@ class Engine:
 
         # set local model resource path
         model.set_local_model_path(local_model_resource_path)
+        # the model json changed, drop any memoized serialization
+        self._model_to_json_cache.pop(model, None)
 
         return model
 
@@ -721,7 +861,7 @@ class Engine:
         """
         Initialize the input model.
         """
-        model_hash = hash_dict(input_model.to_json())
+        model_hash = hash_dict(self._model_to_json(input_model))
 
         # cache the model
         self._cache_model(input_model, model_hash, check_object=False)
@@ -732,18 +872,18 @@ class Engine:
         self,
         pass_name: int,
         input_model_number: str,
-        pass_config: dict,
+        pass_config_hash: str,
         accelerator_spec: AcceleratorSpec,
     ):
         """
         Get the path to the run json.
         """
-        pass_config_hash = hash_dict(pass_config)
+        # built as a plain string to skip Path allocation and normalization on every cache probe
         if not accelerator_spec:
-            run_json_path = self._run_cache_path / f"{pass_name}-{input_model_number}-{pass_config_hash}.json"
+            run_json_path = f"{self._run_cache_prefix}{pass_name}-{input_model_number}-{pass_config_hash}.json"
         else:
             run_json_path = (
-                self._run_cache_path / f"{pass_name}-{input_model_number}-{pass_config_hash}-{accelerator_spec}.json"
+                f"{self._run_cache_prefix}{pass_name}-{input_model_number}-{pass_config_hash}-{accelerator_spec}.json"
             )
         return run_json_path
 
@@ -751,6 +891,7 @@ class Engine:
         self,
         pass_name: int,
         pass_config: dict,
+        pass_config_hash: str,
         input_model_id: str,
         output_model_id: str,
         accelerator_spec: AcceleratorSpec,
@@ -764,31 +905,36 @@ class Engine:
             "input_model_id": input_model_id,
             "output_model_id": output_model_id,
         }
-        input_model_number = input_model_id.split("_")[0]
-        run_json_path = self.get_run_json_path(pass_name, input_model_number, pass_config, accelerator_spec)
+        input_model_number = input_model_id.partition("_")[0]
+        run_json_path = self.get_run_json_path(pass_name, input_model_number, pass_config_hash, accelerator_spec)
+        self._memoize_record(self._run_record_cache, run_json_path, output_model_id)
         try:
-            with open(run_json_path, "w") as f:
-                json.dump(run_json, f, indent=4)
+            dump_json(run_json, run_json_path)
         except Exception as e:
             logger.error(f"Failed to cache run: {e}", exc_info=True)
 
-    def _load_run(self, input_model_id: str, pass_name: int, pass_config: dict, accelerator_spec: AcceleratorSpec):
+    def _load_run(self, input_model_id: str, pass_name: int, pass_config_hash: str, accelerator_spec: AcceleratorSpec):
         """
         Load the run from the cache directory.
         """
-        input_model_number = input_model_id.split("_")[0]
-        run_json_path = self.get_run_json_path(pass_name, input_model_number, pass_config, accelerator_spec)
-        if run_json_path.exists():
-            try:
-                with open(run_json_path, "r") as f:
-                    run_json = json.load(f)
-                output_model_id = run_json["output_model_id"]
-            except Exception as e:
-                logger.error(f"Failed to load run: {e}", exc_info=True)
-                output_model_id = None
-            return output_model_id
-        else:
+        input_model_number = input_model_id.partition("_")[0]
+        run_json_path = self.get_run_json_path(pass_name, input_model_number, pass_config_hash, accelerator_spec)
+        if run_json_path in self._run_record_cache:
+            self._run_record_cache.move_to_end(run_json_path)
+            return self._run_record_cache[run_json_path]
+        # open directly instead of checking existence first to avoid an extra stat per probe
+        try:
+            run_json = load_json(run_json_path)
+            output_model_id = run_json["output_model_id"]
+        except FileNotFoundError:
+            self._memoize_record(self._run_record_cache, run_json_path, None)
+            return None
+        except Exception as e:
+            # don't memoize parse failures so a repaired file is picked up on the next probe
+            logger.error(f"Failed to load run: {e}", exc_info=True)
             return None
+        self._memoize_record(self._run_record_cache, run_json_path, output_model_id)
+        return output_model_id
 
     def _run_passes(
         self,
@@ -802,6 +948,8 @@ class Engine:
         the passes is the list of (pass_name, pass_search_point) tuples
         """
         should_prune = False
+        # the model is only evaluated after the last pass
+        evaluator_config = self.evaluator_for_pass(passes[-1][0])
         # run all the passes in the step
         model_ids = []
         for pass_id, pass_search_point in passes:
@@ -814,7 +962,6 @@ class Engine:
 
         if not should_prune:
             # evaluate the model
-            evaluator_config = self.evaluator_for_pass(pass_id)
             if self.no_search and evaluator_config is None:
                 # skip evaluation if no search and no evaluator
                 signal = None
@@ -827,6 +974,30 @@ class Engine:
 
         return should_prune, signal, model_ids
 
+    def _serialized_pass_config(self, pass_id: str, p: Pass, pass_search_point: Dict[str, Any]):
+        """
+        Get the serialized pass config and its hash for a search point.
+
+        Memoized per (pass id, search point) since the search strategy can revisit the same search
+        point many times and serializing + hashing the config is much more expensive than a lookup.
+        """
+        try:
+            cache_key = (pass_id, tuple(sorted(pass_search_point.items())))
+            cached = self._pass_config_cache.get(cache_key)
+        except TypeError:
+            # search point values are not hashable or sortable, serialize without memoizing
+            cache_key = cached = None
+        if cached is not None:
+            return cached
+
+        pass_config = p.config_at_search_point(pass_search_point)
+        pass_config = p.serialize_config(pass_config)
+        # hash once and reuse for the run cache lookup, the output model id and the run record
+        pass_config_hash = hash_dict(pass_config)
+        if cache_key is not None:
+            self._pass_config_cache[cache_key] = (pass_config, pass_config_hash)
+        return pass_config, pass_config_hash
+
     def _run_pass(
         self,
         pass_id: str,
@@ -842,42 +1013,53 @@ class Engine:
         p: Pass = self.passes[pass_id]["pass"]
         pass_name = p.__class__.__name__
         logger.info(f"Running pass {pass_name}")
-        pass_config = p.config_at_search_point(pass_search_point)
-        pass_config = p.serialize_config(pass_config)
+        pass_config, pass_config_hash = self._serialized_pass_config(pass_id, p, pass_search_point)
+        footprint = self.footprints[accelerator_spec]
+
+        agnostic_key = (pass_id, accelerator_spec)
+        is_agnostic = self._pass_accel_agnostic.get(agnostic_key)
+        if is_agnostic is None:
+            is_agnostic = p.is_accelerator_agnostic(accelerator_spec)
+            self._pass_accel_agnostic[agnostic_key] = is_agnostic
 
         # load run from cache if it exists
-        run_accel = None if p.is_accelerator_agnostic(accelerator_spec) else accelerator_spec
-        output_model_id = self._load_run(input_model_id, pass_name, pass_config, run_accel)
+        run_accel = None if is_agnostic else accelerator_spec
+        output_model_id = self._load_run(input_model_id, pass_name, pass_config_hash, run_accel)
         if output_model_id is not None:
             logger.debug("Loading model from cache ...")
             output_model = self._load_model(output_model_id)
             if output_model is not None:
-                # footprint model and run
-                self.footprints[accelerator_spec].record(
-                    model_id=output_model_id,
-                    model_config=output_model.to_json() if output_model != PRUNED_CONFIG else {"is_pruned": True},
-                    parent_model_id=input_model_id,
-                    from_pass=pass_name,
-                    pass_run_config=pass_config,
-                )
+                # repeated hits for the same run are common during search, record the footprint only once
+                if output_model_id not in footprint.nodes:
+                    footprint.record(
+                        model_id=output_model_id,
+                        model_config=(
+                            self._model_to_json(output_model) if output_model != PRUNED_CONFIG else {"is_pruned": True}
+                        ),
+                        parent_model_id=input_model_id,
+                        from_pass=pass_name,
+                        pass_run_config=pass_config,
+                    )
                 return output_model, output_model_id
 
         # new model id
-        input_model_number = input_model_id.split("_")[0]
+        input_model_number = input_model_id.partition("_")[0]
         # Note: the final output model id need contains the accelerator information
         # if the output model is accelerator dependent.
         output_model_id_parts = [
             f"{self._get_new_model_number()}_{pass_name}",
             input_model_number,
-            hash_dict(pass_config),
+            pass_config_hash,
         ]
 
-        if not p.is_accelerator_agnostic(accelerator_spec):
+        if not is_agnostic:
             output_model_id_parts.append(f"{accelerator_spec}")
 
-        output_model_id = "-".join(map(str, output_model_id_parts))
+        output_model_id = "-".join(output_model_id_parts)
         output_model_path = self._model_cache_path / f"{output_model_id}" / "output_model"
-        output_model_path.parent.mkdir(parents=True, exist_ok=True)
+        # the model cache directory itself is created in initialize(), so only the per-model
+        # subdirectory needs to be made here
+        output_model_path.parent.mkdir(exist_ok=True)
         output_model_path = str(output_model_path)
 
         # prune if invalid search_point
@@ -909,12 +1091,12 @@ class Engine:
         self._cache_model(output_model, output_model_id)
 
         # cache run
-        self._cache_run(pass_name, pass_config, input_model_id, output_model_id, run_accel)
+        self._cache_run(pass_name, pass_config, pass_config_hash, input_model_id, output_model_id, run_accel)
 
         # footprint model and run
-        self.footprints[accelerator_spec].record(
+        footprint.record(
             model_id=output_model_id,
-            model_config=output_model.to_json() if output_model != PRUNED_CONFIG else {"is_pruned": True},
+            model_config=self._model_to_json(output_model) if output_model != PRUNED_CONFIG else {"is_pruned": True},
             parent_model_id=input_model_id,
             from_pass=pass_name,
             pass_run_config=pass_config,
@@ -937,9 +1119,9 @@ class Engine:
             "signal": signal.dict(),
         }
         evaluation_json_path = self.get_evaluation_json_path(model_id)
+        self._memoize_record(self._evaluation_record_cache, evaluation_json_path, signal)
         try:
-            with open(evaluation_json_path, "w") as f:
-                json.dump(evaluation_json, f, indent=4)
+            dump_json(evaluation_json, evaluation_json_path)
         except Exception as e:
             logger.error(f"Failed to cache evaluation: {e}", exc_info=True)
 
@@ -948,18 +1130,22 @@ class Engine:
         Load the evaluation from the cache directory.
         """
         evaluation_json_path = self.get_evaluation_json_path(model_id)
-        if evaluation_json_path.exists():
-            try:
-                with open(evaluation_json_path, "r") as f:
-                    evaluation_json = json.load(f)
-                signal = evaluation_json["signal"]
-                signal = MetricResult(**signal)
-            except Exception as e:
-                logger.error(f"Failed to load evaluation: {e}", exc_info=True)
-                signal = None
-            return signal
-        else:
+        if evaluation_json_path in self._evaluation_record_cache:
+            self._evaluation_record_cache.move_to_end(evaluation_json_path)
+            return self._evaluation_record_cache[evaluation_json_path]
+        # open directly instead of checking existence first to avoid an extra stat per probe
+        try:
+            evaluation_json = load_json(evaluation_json_path)
+            signal = MetricResult(**evaluation_json["signal"])
+        except FileNotFoundError:
+            self._memoize_record(self._evaluation_record_cache, evaluation_json_path, None)
+            return None
+        except Exception as e:
+            # don't memoize parse failures so a repaired file is picked up on the next probe
+            logger.error(f"Failed to load evaluation: {e}", exc_info=True)
             return None
+        self._memoize_record(self._evaluation_record_cache, evaluation_json_path, signal)
+        return signal
 
     def _evaluate_model(
         self,
@@ -979,12 +1165,14 @@ class Engine:
         else:
             model_id_with_accelerator = model_id
 
+        footprint = self.footprints[accelerator_spec]
+
         # load evaluation from cache if it exists
         signal = self._load_evaluation(model_id_with_accelerator)
         if signal is not None:
             logger.debug("Loading evaluation from cache ...")
             # footprint evaluation
-            self.footprints[accelerator_spec].record(
+            footprint.record(
                 model_id=model_id,
                 metrics=FootprintNodeMetric(
                     value=signal,
@@ -1003,7 +1191,7 @@ class Engine:
         self._cache_evaluation(model_id_with_accelerator, signal)
 
         # footprint evaluation
-        self.footprints[accelerator_spec].record(
+        footprint.record(
             model_id=model_id,
             metrics=FootprintNodeMetric(
                 value=signal,
@@ -1015,16 +1203,13 @@ class Engine:
     def _get_top_ranked_nodes(
         self, objective_dict: Dict[str, Any], footprint: Footprint, k: int
     ) -> List[FootprintNode]:
-        footprint_node_list = footprint.nodes.values()
-        sorted_footprint_node_list = sorted(
-            footprint_node_list,
-            key=lambda x: tuple(
-                x.metrics.value[metric].value
-                if x.metrics.cmp_direction[metric] == 1
-                else -x.metrics.value[metric].value
-                for metric in objective_dict.keys()
-            ),
-            reverse=True,
-        )
-        selected_footprint_nodes = sorted_footprint_node_list[:k]
+        metric_names = list(objective_dict)
+
+        def sort_key(node: FootprintNode):
+            metrics = node.metrics
+            # negate the signed values so that nsmallest returns the best nodes first
+            return tuple(-metrics.value[metric].value * metrics.cmp_direction[metric] for metric in metric_names)
+
+        # O(N log k) instead of fully sorting the footprint just to keep the top k nodes
+        selected_footprint_nodes = heapq.nsmallest(k, footprint.nodes.values(), key=sort_key)
         return selected_footprint_nodes
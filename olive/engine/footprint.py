@@ -72,32 +72,38 @@ class Footprint:
 
     def record_objective_dict(self, objective_dict):
         self.objective_dict = objective_dict
+        # the goals apply to every node, re-resolve the ones recorded before the objectives were known
+        self.resolve_metrics()
 
     def _is_empty_metric(self, metric: FootprintNodeMetric):
         return not metric
 
     def resolve_metrics(self):
-        for k, v in self.nodes.items():
-            if self._is_empty_metric(v.metrics):
-                continue
-            if self.nodes[k].metrics.cmp_direction is None:
-                self.nodes[k].metrics.cmp_direction = {}
+        for k in self.nodes:
+            self._resolve_node_metrics(k)
 
-            is_goals_met = []
-            for metric_name in v.metrics.value:
-                if metric_name not in self.objective_dict:
-                    logger.debug(f"There is no goal set for metric: {metric_name}.")
-                    continue
-                higher_is_better = self.objective_dict[metric_name]["higher_is_better"]
-                cmp_direction = 1 if higher_is_better else -1
-                self.nodes[k].metrics.cmp_direction[metric_name] = cmp_direction
+    def _resolve_node_metrics(self, model_id):
+        v = self.nodes[model_id]
+        if self._is_empty_metric(v.metrics):
+            return
+        if v.metrics.cmp_direction is None:
+            v.metrics.cmp_direction = {}
 
-                _goal = self.objective_dict[metric_name]["goal"]
-                if _goal is None:
-                    is_goals_met.append(True)
-                else:
-                    is_goals_met.append(v.metrics.value[metric_name].value * cmp_direction >= _goal)
-            self.nodes[k].metrics.is_goals_met = all(is_goals_met)
+        is_goals_met = []
+        for metric_name in v.metrics.value:
+            if metric_name not in self.objective_dict:
+                logger.debug(f"There is no goal set for metric: {metric_name}.")
+                continue
+            higher_is_better = self.objective_dict[metric_name]["higher_is_better"]
+            cmp_direction = 1 if higher_is_better else -1
+            v.metrics.cmp_direction[metric_name] = cmp_direction
+
+            _goal = self.objective_dict[metric_name]["goal"]
+            if _goal is None:
+                is_goals_met.append(True)
+            else:
+                is_goals_met.append(v.metrics.value[metric_name].value * cmp_direction >= _goal)
+        v.metrics.is_goals_met = all(is_goals_met)
 
     def record(self, foot_print_node: FootprintNode = None, **kwargs):
         _model_id = kwargs.get("model_id", None)
@@ -108,7 +114,8 @@ class Footprint:
             self.nodes[_model_id].update(**kwargs)
         else:
             self.nodes[_model_id] = FootprintNode(**kwargs)
-        self.resolve_metrics()
+        # only the recorded node needs resolving, the other nodes are unchanged
+        self._resolve_node_metrics(_model_id)
 
     def get_candidates(self):
         return {
@@ -121,10 +128,21 @@ class Footprint:
         if self.is_marked_pareto_frontier:
             return
         candidates = self.get_candidates()
+        # precompute each candidate's comparison values (metric value * cmp_direction) once
+        # instead of recomputing them inside the quadratic dominance loop below
+        cmp_values = {}
+        for k, v in candidates.items():
+            cmp_direction = v.metrics.cmp_direction
+            cmp_values[k] = {
+                metric_name: sub_res.value * cmp_direction[metric_name]
+                for metric_name, sub_res in v.metrics.value.items()
+                if metric_name in cmp_direction
+            }
         for k, v in candidates.items():
+            current_values = cmp_values[k]
             # if current point's metrics is less than any other point's metrics, it is not pareto frontier
             cmp_flag = True
-            for _k, _v in candidates.items():
+            for _k in candidates:
                 if k == _k:
                     # don't compare the point with itself
                     continue
@@ -139,12 +157,13 @@ class Footprint:
                 # Note: equal points don't dominate one another
                 equal = True  # two points are equal
                 dominated = True  # current point is dominated by other point
+                other_values = cmp_values[_k]
                 for metric_name in v.metrics.value:
-                    if metric_name not in _v.metrics.cmp_direction:
+                    if metric_name not in other_values:
                         logger.debug(f"Metric {metric_name} is not in cmp_direction, will not be compared.")
                         continue
-                    other_point_metrics = _v.metrics.value[metric_name].value * _v.metrics.cmp_direction[metric_name]
-                    current_point_metrics = v.metrics.value[metric_name].value * v.metrics.cmp_direction[metric_name]
+                    other_point_metrics = other_values[metric_name]
+                    current_point_metrics = current_values[metric_name]
                     dominated &= current_point_metrics <= other_point_metrics
                     equal &= current_point_metrics == other_point_metrics
                 # point is not on pareto frontier if dominated and not equal
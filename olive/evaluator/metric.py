@@ -163,6 +163,18 @@ class MetricResult(ConfigDictBase):
     __root__: Dict[str, SubMetricResult]
     delimiter: ClassVar[str] = "-"
 
+    def to_json(self, check_object: bool = False) -> dict:
+        # sub-metric results only hold json-native values, so build the dict directly
+        # instead of going through the json round trip in serialize_to_json
+        return {
+            key: {
+                "value": sub_result.value,
+                "priority": sub_result.priority,
+                "higher_is_better": sub_result.higher_is_better,
+            }
+            for key, sub_result in self.__root__.items()
+        }
+
     def get_value(self, metric_name, sub_type_name):
         if not self.__root__:
             return None
@@ -4,6 +4,7 @@
 # --------------------------------------------------------------------------
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from typing import Union
 
 
@@ -30,6 +31,11 @@ class AcceleratorSpec:
     num_cores: int = None
 
     def __str__(self) -> str:
+        return self._str_repr
+
+    @cached_property
+    def _str_repr(self) -> str:
+        # cached since the spec is immutable and formatted many times for output names and cache keys
         # remove the suffix "ExecutionProvider", len("ExecutionProvider") = 17
         ep = self.execution_provider[:-17] or self.execution_provider
         return f"{str(self.accelerator_type).lower()}-{ep.lower()}"
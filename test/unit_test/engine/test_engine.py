@@ -20,6 +20,7 @@ import pytest
 from olive.common.utils import hash_dict
 from olive.engine import Engine
 from olive.evaluator.metric import AccuracySubType, MetricResult, joint_metric_key
+from olive.evaluator.metric_config import MetricGoal
 from olive.evaluator.olive_evaluator import OliveEvaluatorConfig
 from olive.hardware import DEFAULT_CPU_ACCELERATOR
 from olive.model import PyTorchModel
@@ -293,9 +294,10 @@ class TestEngine:
         assert result_json_path.is_file()
         assert MetricResult.parse_file(result_json_path) == actual_res
 
+    @patch.object(Path, "iterdir", return_value=[Path("cache") / "output" / "100_model.json"])
     @patch.object(Path, "glob", return_value=[Path("cache") / "output" / "100_model.json"])
     @patch.object(Path, "unlink")
-    def test_model_path_suffix(self, mock_unlink, mock_glob):
+    def test_model_path_suffix(self, mock_unlink, mock_glob, mock_iterdir):
         # setup
         metric = get_accuracy_metric(AccuracySubType.ACCURACY_SCORE)
         evaluator_config = OliveEvaluatorConfig(metrics=[metric])
@@ -312,7 +314,8 @@ class TestEngine:
 
         assert engine._new_model_number == 101
         assert mock_unlink.call_count == 1
-        assert mock_glob.call_count == 2
+        assert mock_iterdir.call_count == 1
+        assert mock_glob.call_count == 1
 
     def test_model_path_suffix_with_exception(self):
         # setup
@@ -326,8 +329,8 @@ class TestEngine:
         }
         engine = Engine(options, host=LocalSystem(), target=LocalSystem(), evaluator_config=evaluator_config)
         engine.register(OnnxConversion, clean_run_cache=True)
-        with patch.object(Path, "glob"):
-            Path.glob.return_value = [Path("cache") / "output" / "435d_0.json"]
+        with patch.object(Path, "iterdir"):
+            Path.iterdir.return_value = [Path("cache") / "output" / "435d_0.json"]
 
             with pytest.raises(ValueError) as exc_info:
                 engine.initialize()
@@ -383,6 +386,67 @@ class TestEngine:
 
         mock_local_system.run_pass.assert_called_once()
 
+    @patch("olive.systems.local.LocalSystem")
+    @patch("onnxruntime.get_available_providers")
+    def test_baseline_reuse_across_accelerators(self, mock_get_available_providers, mock_local_system):
+        # setup
+        metric = get_accuracy_metric(AccuracySubType.ACCURACY_SCORE)
+        # a non-threshold goal forces a baseline evaluation of the input model
+        for sub_type in metric.sub_types:
+            sub_type.goal = MetricGoal(type="percent-max-degradation", value=1)
+        evaluator_config = OliveEvaluatorConfig(metrics=[metric])
+        options = {
+            "cache_dir": "./cache",
+            "clean_cache": True,
+            "search_strategy": {
+                "execution_order": "joint",
+                "search_algorithm": "random",
+            },
+            "clean_evaluation_cache": True,
+        }
+        mock_local_system.system_type = SystemType.Local
+        mock_local_system.accelerators = ["GPU", "CPU"]
+        mock_local_system.get_supported_execution_providers.return_value = [
+            "CUDAExecutionProvider",
+            "CPUExecutionProvider",
+        ]
+        mock_get_available_providers.return_value = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+        mock_local_system.run_pass.return_value = get_onnx_model()
+        metric_result_dict = {
+            joint_metric_key(metric.name, sub_metric.name): {
+                "value": 0.998,
+                "priority": sub_metric.priority,
+                "higher_is_better": sub_metric.higher_is_better,
+            }
+            for sub_metric in metric.sub_types
+        }
+        mock_local_system.evaluate_model.return_value = MetricResult.parse_obj(metric_result_dict)
+
+        engine = Engine(options, host=mock_local_system, target=mock_local_system, evaluator_config=evaluator_config)
+        assert len(engine.accelerator_specs) == 2
+        engine.register(OnnxConversion, clean_run_cache=True)
+
+        pytorch_model = get_pytorch_model()
+        input_model_id = hash_dict(pytorch_model.to_json())
+
+        # execute
+        temp_dir = tempfile.TemporaryDirectory()
+        output_dir = Path(temp_dir.name)
+        _ = engine.run(pytorch_model, output_dir=output_dir)
+
+        # assert
+        # accuracy metrics don't depend on the accelerator, so the baseline of the input model
+        # is evaluated once and reused for the second accelerator
+        baseline_calls = [
+            call for call in mock_local_system.evaluate_model.call_args_list if call[0][0] is pytorch_model
+        ]
+        assert len(baseline_calls) == 1
+        # the reused baseline is still recorded in each accelerator's footprint
+        for accelerator_spec in engine.accelerator_specs:
+            footprint = engine.footprints[accelerator_spec]
+            assert input_model_id in footprint.nodes
+            assert footprint.nodes[input_model_id].metrics.value == MetricResult.parse_obj(metric_result_dict)
+
     @patch("olive.systems.local.LocalSystem")
     @patch("onnxruntime.get_available_providers")
     def test_pass_cache(self, mock_get_available_providers, mock_local_system):